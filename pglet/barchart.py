@@ -60,7 +60,7 @@ class BarChart(Control):
     # tooltips
     @property
     def tooltips(self):
-        return self._get_attr("tooltips", data_type="bool", def_value=False)
+        return self._get_bool_attr("tooltips", def_value=False)
 
     @tooltips.setter
     @beartype
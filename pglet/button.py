@@ -93,7 +93,7 @@ class Button(Control):
     # primary
     @property
     def primary(self):
-        return self._get_attr("primary", data_type="bool", def_value=False)
+        return self._get_bool_attr("primary", def_value=False)
 
     @primary.setter
     @beartype
@@ -103,7 +103,7 @@ class Button(Control):
     # compound
     @property
     def compound(self):
-        return self._get_attr("compound", data_type="bool", def_value=False)
+        return self._get_bool_attr("compound", def_value=False)
 
     @compound.setter
     @beartype
@@ -113,7 +113,7 @@ class Button(Control):
     # action
     @property
     def action(self):
-        return self._get_attr("action", data_type="bool", def_value=False)
+        return self._get_bool_attr("action", def_value=False)
 
     @action.setter
     @beartype
@@ -123,7 +123,7 @@ class Button(Control):
     # toolbar
     @property
     def toolbar(self):
-        return self._get_attr("toolbar", data_type="bool", def_value=False)
+        return self._get_bool_attr("toolbar", def_value=False)
 
     @toolbar.setter
     @beartype
@@ -133,7 +133,7 @@ class Button(Control):
     # split
     @property
     def split(self):
-        return self._get_attr("split", data_type="bool", def_value=False)
+        return self._get_bool_attr("split", def_value=False)
 
     @split.setter
     @beartype
@@ -170,7 +170,7 @@ class Button(Control):
     # new_window
     @property
     def new_window(self):
-        return self._get_attr("newWindow", data_type="bool", def_value=False)
+        return self._get_bool_attr("newWindow", def_value=False)
 
     @new_window.setter
     @beartype
@@ -210,7 +210,7 @@ class Button(Control):
     # focused
     @property
     def focused(self):
-        return self._get_attr("focused", data_type="bool", def_value=False)
+        return self._get_bool_attr("focused", def_value=False)
 
     @focused.setter
     @beartype
@@ -339,7 +339,7 @@ class MenuItem(Control):
     # new_window
     @property
     def new_window(self):
-        return self._get_attr("newWindow", data_type="bool", def_value=False)
+        return self._get_bool_attr("newWindow", def_value=False)
 
     @new_window.setter
     @beartype
@@ -367,7 +367,7 @@ class MenuItem(Control):
     # icon_only
     @property
     def icon_only(self):
-        return self._get_attr("iconOnly", data_type="bool", def_value=False)
+        return self._get_bool_attr("iconOnly", def_value=False)
 
     @icon_only.setter
     @beartype
@@ -377,7 +377,7 @@ class MenuItem(Control):
     # split
     @property
     def split(self):
-        return self._get_attr("split", data_type="bool", def_value=False)
+        return self._get_bool_attr("split", def_value=False)
 
     @split.setter
     @beartype
@@ -387,7 +387,7 @@ class MenuItem(Control):
     # divider
     @property
     def divider(self):
-        return self._get_attr("divider", data_type="bool", def_value=False)
+        return self._get_bool_attr("divider", def_value=False)
 
     @divider.setter
     @beartype
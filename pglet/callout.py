@@ -131,7 +131,7 @@ class Callout(Control):
     # beak
     @property
     def beak(self):
-        return self._get_attr("beak", data_type="bool", def_value=True)
+        return self._get_bool_attr("beak", def_value=True)
 
     @beak.setter
     @beartype
@@ -161,7 +161,7 @@ class Callout(Control):
     # focus
     @property
     def focus(self):
-        return self._get_attr("focus", data_type="bool", def_value=False)
+        return self._get_bool_attr("focus", def_value=False)
 
     @focus.setter
     @beartype
@@ -171,7 +171,7 @@ class Callout(Control):
     # cover
     @property
     def cover(self):
-        return self._get_attr("cover", data_type="bool", def_value=False)
+        return self._get_bool_attr("cover", def_value=False)
 
     @cover.setter
     @beartype
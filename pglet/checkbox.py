@@ -66,7 +66,7 @@ class Checkbox(Control):
     # value
     @property
     def value(self):
-        return self._get_attr("value", data_type="bool", def_value=False)
+        return self._get_bool_attr("value", def_value=False)
 
     @value.setter
     @beartype
@@ -105,7 +105,7 @@ class Checkbox(Control):
     # focused
     @property
     def focused(self):
-        return self._get_attr("focused", data_type="bool", def_value=False)
+        return self._get_bool_attr("focused", def_value=False)
 
     @focused.setter
     @beartype
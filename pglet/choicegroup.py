@@ -93,7 +93,7 @@ class ChoiceGroup(Control):
     # focused
     @property
     def focused(self):
-        return self._get_attr("focused", data_type="bool", def_value=False)
+        return self._get_bool_attr("focused", def_value=False)
 
     @focused.setter
     @beartype
@@ -131,7 +131,7 @@ class ComboBox(Control):
     # focused
     @property
     def focused(self):
-        return self._get_attr("focused", data_type="bool", def_value=False)
+        return self._get_bool_attr("focused", def_value=False)
 
     @focused.setter
     @beartype
@@ -141,7 +141,7 @@ class ComboBox(Control):
     # multi_select
     @property
     def multi_select(self):
-        return self._get_attr("multiselect", data_type="bool", def_value=False)
+        return self._get_bool_attr("multiselect", def_value=False)
 
     @multi_select.setter
     @beartype
@@ -151,7 +151,7 @@ class ComboBox(Control):
     # allow_free_form
     @property
     def allow_free_form(self):
-        return self._get_attr("allowfreeform", data_type="bool", def_value=False)
+        return self._get_bool_attr("allowfreeform", def_value=False)
 
     @allow_free_form.setter
     @beartype
@@ -161,7 +161,7 @@ class ComboBox(Control):
     # auto_complete
     @property
     def auto_complete(self):
-        return self._get_attr("autocomplete", data_type="bool", def_value=True)
+        return self._get_bool_attr("autocomplete", def_value=True)
 
     @auto_complete.setter
     @beartype
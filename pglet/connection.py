@@ -1,12 +1,19 @@
-import json
 import logging
 import threading
 import uuid
 
 from pglet.protocol import *
+from pglet.protocol import _json_dumps, _json_loads
 from pglet.reconnecting_websocket import ReconnectingWebSocket
 
 
+# payload type and Connection handler attribute of server-initiated messages
+_PAYLOAD_BY_ACTION = {
+    Actions.PAGE_EVENT_TO_HOST: (PageEventPayload, "_on_event"),
+    Actions.SESSION_CREATED: (PageSessionCreatedPayload, "_on_session_created"),
+}
+
+
 class Connection:
     def __init__(self, ws: ReconnectingWebSocket):
         self._ws = ws
@@ -38,39 +45,35 @@ class Connection:
 
     def _on_message(self, data):
         logging.debug(f"_on_message: {data}")
-        msg_dict = json.loads(data)
-        msg = Message(**msg_dict)
-        if msg.id != "":
+        # dispatch on the decoded dict: no Message wrapper per frame
+        msg = _json_loads(data)
+        msg_id = msg["id"]
+        payload = msg["payload"]
+        if msg_id != "":
             # callback
-            evt = self._ws_callbacks[msg.id][0]
-            self._ws_callbacks[msg.id] = (None, msg.payload)
+            evt = self._ws_callbacks[msg_id][0]
+            self._ws_callbacks[msg_id] = (None, payload)
             evt.set()
-        elif msg.action == Actions.PAGE_EVENT_TO_HOST:
-            if self._on_event != None:
-                th = threading.Thread(
-                    target=self._on_event,
-                    args=(
-                        self,
-                        PageEventPayload(**msg.payload),
-                    ),
-                    daemon=True,
-                )
-                th.start()
-                # self._on_event(self, PageEventPayload(**msg.payload))
-        elif msg.action == Actions.SESSION_CREATED:
-            if self._on_session_created != None:
-                th = threading.Thread(
-                    target=self._on_session_created,
-                    args=(
-                        self,
-                        PageSessionCreatedPayload(**msg.payload),
-                    ),
-                    daemon=True,
-                )
-                th.start()
-        else:
+            return
+
+        dispatch = _PAYLOAD_BY_ACTION.get(msg["action"])
+        if dispatch is None:
             # it's something else
-            print(msg.payload)
+            print(payload)
+            return
+
+        payload_cls, handler_attr = dispatch
+        handler = getattr(self, handler_attr)
+        if handler != None:
+            th = threading.Thread(
+                target=handler,
+                args=(
+                    self,
+                    payload_cls(**payload),
+                ),
+                daemon=True,
+            )
+            th.start()
 
     def register_host_client(
         self,
@@ -110,7 +113,7 @@ class Connection:
     def _send_message_with_result(self, action_name, payload):
         msg_id = uuid.uuid4().hex
         msg = Message(msg_id, action_name, payload)
-        j = json.dumps(msg, default=vars)
+        j = _json_dumps(msg)
         logging.debug(f"_send_message_with_result: {j}")
         evt = threading.Event()
         self._ws_callbacks[msg_id] = (evt, None)
@@ -1,11 +1,12 @@
 import datetime as dt
+import sys
 import threading
 from difflib import SequenceMatcher
 from beartype.typing import List, Optional, Union
 
 from beartype import beartype
 
-from pglet.protocol import Command
+from pglet.protocol import acquire_command, release_commands
 from pglet.ref import Ref
 
 try:
@@ -49,8 +50,125 @@ TextSize = Literal[
 
 TextAlign = Literal[None, "left", "right", "center", "justify"]
 
+# guards lazy creation of per-control locks
+_lock_init_lock = threading.Lock()
+
+
+_TRUE = "true"
+_FALSE = "false"
+
+# lower-cased, interned attribute names keyed by the name passed to _get_attr/_set_attr
+_attr_names = {}
+
+
+def _attr_name(name):
+    n = _attr_names.get(name)
+    if n is None:
+        n = _attr_names[name] = sys.intern(name.lower())
+    return n
+
+
+# attribute value formatters by type; values of other types are formatted with str()
+_FORMATTERS = {
+    int: str,
+    float: str,
+    bool: lambda v: _TRUE if v else _FALSE,
+    dt.datetime: lambda v: v.isoformat(),
+    dt.date: lambda v: v.isoformat(),
+}
+
+
+def _format_attr_value(val):
+    # exact type misses (subclasses) resolve through the nearest formatted base
+    for t in type(val).__mro__:
+        fmt = _FORMATTERS.get(t)
+        if fmt is not None:
+            return fmt(val)
+    return str(val)
+
+
+def _parse_bool(s):
+    return s.lower() == _TRUE
+
+
+# control attribute exposed as a property: reads go straight to the attribute
+# dict (string values converted with cast), writes are checked against types
+# (None always allowed) and go through _set_attr for dirty tracking
+class _AttrProp:
+    __slots__ = ("name", "def_value", "readonly", "types", "cast", "prop_name")
+
+    def __init__(self, name, def_value=None, readonly=False, types=None, cast=None):
+        self.name = _attr_name(name)
+        self.def_value = def_value
+        self.readonly = readonly
+        self.types = types
+        self.cast = cast
+        self.prop_name = name
+
+    def __set_name__(self, owner, name):
+        self.prop_name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        t = obj._attrs.get(self.name)
+        if t is None:
+            return self.def_value
+        v = t[0]
+        if self.cast is not None and isinstance(v, str):
+            return self.cast(v)
+        return v
+
+    def __set__(self, obj, value):
+        if self.readonly:
+            raise AttributeError(f"can't set attribute '{self.prop_name}'")
+        if (
+            self.types is not None
+            and value is not None
+            and not isinstance(value, self.types)
+        ):
+            expected = ", ".join(t.__name__ for t in self.types)
+            raise TypeError(
+                f"{self.prop_name} must be {expected} or None, not {type(value).__name__}"
+            )
+        obj._set_attr(self.name, value)
+
+
+def _fast_opcodes(prev, curr):
+    # trivial diffs that don't need SequenceMatcher; None if a real diff is required
+    if not prev:
+        return [("insert", 0, 0, 0, len(curr))] if curr else []
+    if not curr:
+        return [("delete", 0, len(prev), 0, 0)]
+    if prev == curr:
+        return [("equal", 0, len(prev), 0, len(curr))]
+    return None
+
 
 class Control:
+    # subclasses that want instances without __dict__ must declare __slots__ as well
+    __slots__ = (
+        "__page",
+        "_attrs",
+        "__attr_names",
+        "__attrs_dirty",
+        "__previous_children",
+        "_uid",
+        "__event_handlers",
+        "__lock",
+    )
+
+    # control name resolved once per class, see __init_subclass__
+    _control_name = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        try:
+            cls._control_name = cls._get_control_name(cls)
+        except Exception:
+            # name depends on the instance or the class is abstract
+            cls._control_name = None
+
     def __init__(
         self,
         id=None,
@@ -63,13 +181,16 @@ class Control:
         disabled=None,
         data=None,
     ):
+        # internal state is assigned unconditionally and in slot order
         self.__page = None
-        self.__attrs = {}
+        self._attrs = {}
+        self.__attr_names = []
+        self.__attrs_dirty = False
         self.__previous_children = []
+        self._uid = "page" if id == "page" else None
+        self.__event_handlers = {}
+        self.__lock = None
         self.id = id
-        self.__uid = None
-        if id == "page":
-            self.__uid = "page"
         self.width = width
         self.height = height
         self.padding = padding
@@ -77,11 +198,41 @@ class Control:
         self.visible = visible
         self.disabled = disabled
         self.data = data
-        self.__event_handlers = {}
-        self._lock = threading.Lock()
         if ref:
             ref.current = self
 
+    # creates count identical controls: the constructor and its property
+    # setters run once, the remaining controls are copies of the first one
+    @classmethod
+    def bulk_create(cls, count, **kwargs):
+        if count <= 0:
+            return []
+        first = cls(**kwargs)
+        if first._get_children():
+            raise ValueError("bulk_create() does not support controls with children")
+        return [first] + [first._clone() for _ in range(count - 1)]
+
+    def _clone(self):
+        c = object.__new__(type(self))
+        c.__page = None
+        c._attrs = self._attrs.copy()
+        c.__attr_names = self.__attr_names
+        c.__attrs_dirty = self.__attrs_dirty
+        c.__previous_children = []
+        c._uid = None
+        c.__event_handlers = self.__event_handlers.copy()
+        c.__lock = None
+        # state of subclasses without __slots__
+        d = getattr(self, "__dict__", None)
+        if d:
+            c.__dict__.update(
+                {
+                    k: v.copy() if isinstance(v, (list, dict)) else v
+                    for k, v in d.items()
+                }
+            )
+        return c
+
     def _assign(self, variable):
         variable = self
 
@@ -98,21 +249,56 @@ class Control:
         return self.__event_handlers.get(event_name)
 
     def _get_attr(self, name, def_value=None, data_type="string"):
-        name = name.lower()
-        if not name in self.__attrs:
+        name = _attr_name(name)
+        if not name in self._attrs:
             return def_value
 
-        s_val = self.__attrs[name][0]
+        s_val = self._attrs[name][0]
         if data_type == "bool" and s_val != None and isinstance(s_val, str):
-            return s_val.lower() == "true"
+            return s_val.lower() == _TRUE
         elif data_type == "float" and s_val != None and isinstance(s_val, str):
             return float(s_val)
         else:
             return s_val
 
+    def _get_bool_attr(self, name, def_value=None):
+        t = self._attrs.get(_attr_name(name))
+        if t is None:
+            return def_value
+        v = t[0]
+        return v.lower() == _TRUE if isinstance(v, str) else v
+
+    def _get_float_attr(self, name, def_value=None):
+        t = self._attrs.get(_attr_name(name))
+        if t is None:
+            return def_value
+        v = t[0]
+        return float(v) if isinstance(v, str) else v
+
     def _set_attr(self, name, value, dirty=True):
         self._set_attr_internal(name, value, dirty)
 
+    def _set_attrs(self, attrs, dirty=True):
+        if type(self)._set_attr is not Control._set_attr:
+            # subclass converts values on the way in
+            for name, value in attrs.items():
+                self._set_attr(name, value, dirty)
+            return
+
+        own_attrs = self._attrs
+        new_attrs = {}
+        for name, value in attrs.items():
+            name = _attr_name(name)
+            if value == None:
+                if name not in own_attrs:
+                    continue
+                value = ""
+            new_attrs[name] = (value, dirty)
+
+        own_attrs.update(new_attrs)
+        if dirty and new_attrs:
+            self.__attrs_dirty = True
+
     def _get_value_or_list_attr(self, name, delimiter):
         v = self._get_attr(name)
         if v and delimiter in v:
@@ -125,8 +311,8 @@ class Control:
         self._set_attr(name, value)
 
     def _set_attr_internal(self, name, value, dirty=True):
-        name = name.lower()
-        orig_val = self.__attrs.get(name)
+        name = _attr_name(name)
+        orig_val = self._attrs.get(name)
 
         if orig_val == None and value == None:
             return
@@ -134,8 +320,26 @@ class Control:
         if value == None:
             value = ""
 
-        if orig_val == None or orig_val[0] != value:
-            self.__attrs[name] = (value, dirty)
+        if orig_val == None:
+            self._attrs[name] = (value, dirty)
+        elif orig_val[0] != value:
+            self._attrs[name] = (value, dirty)
+        else:
+            return
+
+        if dirty:
+            self.__attrs_dirty = True
+
+    # _lock
+    @property
+    def _lock(self):
+        lock = self.__lock
+        if lock is None:
+            with _lock_init_lock:
+                if self.__lock is None:
+                    self.__lock = threading.Lock()
+                lock = self.__lock
+        return lock
 
     # event_handlers
     @property
@@ -164,7 +368,7 @@ class Control:
     # uid
     @property
     def uid(self):
-        return self.__uid
+        return self._uid
 
     @id.setter
     def id(self, value):
@@ -209,7 +413,7 @@ class Control:
     # visible
     @property
     def visible(self):
-        return self._get_attr("visible", data_type="bool", def_value=True)
+        return self._get_bool_attr("visible", def_value=True)
 
     @visible.setter
     @beartype
@@ -219,7 +423,7 @@ class Control:
     # disabled
     @property
     def disabled(self):
-        return self._get_attr("disabled", data_type="bool", def_value=False)
+        return self._get_bool_attr("disabled", def_value=False)
 
     @disabled.setter
     @beartype
@@ -254,6 +458,8 @@ class Control:
         if len(update_cmd.attrs) > 0:
             update_cmd.name = "set"
             commands.append(update_cmd)
+        else:
+            release_commands([update_cmd])
 
         # go through children
         previous_children = self.__previous_children
@@ -274,18 +480,24 @@ class Control:
         # print("previous_ints:", previous_ints)
         # print("current_ints:", current_ints)
 
-        sm = SequenceMatcher(None, previous_ints, current_ints)
+        opcodes = _fast_opcodes(previous_ints, current_ints)
+        if opcodes is None:
+            opcodes = SequenceMatcher(None, previous_ints, current_ints).get_opcodes()
+
+        # removed children are sent as a single "remove" command placed before
+        # any other command for this control's children, so "at" indexes of added
+        # children stay valid
+        remove_at = len(commands)
+        remove_ids = []
 
         n = 0
-        for tag, a1, a2, b1, b2 in sm.get_opcodes():
+        for tag, a1, a2, b1, b2 in opcodes:
             if tag == "delete":
                 # deleted controls
-                ids = []
                 for h in previous_ints[a1:a2]:
                     ctrl = hashes[h]
                     self._remove_control_recursively(index, ctrl)
-                    ids.append(ctrl.__uid)
-                commands.append(Command(0, "remove", ids, None, None, None))
+                    remove_ids.append(ctrl._uid)
             elif tag == "equal":
                 # unchanged control
                 for h in previous_ints[a1:a2]:
@@ -293,13 +505,11 @@ class Control:
                     ctrl.build_update_commands(index, added_controls, commands)
                     n += 1
             elif tag == "replace":
-                ids = []
                 for h in previous_ints[a1:a2]:
                     # delete
                     ctrl = hashes[h]
                     self._remove_control_recursively(index, ctrl)
-                    ids.append(ctrl.__uid)
-                commands.append(Command(0, "remove", ids, None, None, None))
+                    remove_ids.append(ctrl._uid)
                 for h in current_ints[b1:b2]:
                     # add
                     ctrl = hashes[h]
@@ -307,11 +517,11 @@ class Control:
                         index=index, added_controls=added_controls
                     )
                     commands.append(
-                        Command(
+                        acquire_command(
                             0,
                             "add",
                             None,
-                            {"to": self.__uid, "at": str(n)},
+                            {"to": self._uid, "at": str(n)},
                             None,
                             innerCmds,
                         )
@@ -325,40 +535,60 @@ class Control:
                         index=index, added_controls=added_controls
                     )
                     commands.append(
-                        Command(
+                        acquire_command(
                             0,
                             "add",
                             None,
-                            {"to": self.__uid, "at": str(n)},
+                            {"to": self._uid, "at": str(n)},
                             None,
                             innerCmds,
                         )
                     )
                     n += 1
 
-        self.__previous_children.clear()
-        self.__previous_children.extend(current_children)
+        if remove_ids:
+            commands.insert(
+                remove_at, acquire_command(0, "remove", remove_ids, None, None, None)
+            )
+
+        self._set_previous_children(current_children)
 
-    def _remove_control_recursively(self, index, control):
-        for child in control._get_children():
-            self._remove_control_recursively(index, child)
+    def _set_previous_children(self, children):
+        pc = self.__previous_children
+        if pc is children:
+            return
+        if len(pc) == len(children) and all(a is b for a, b in zip(pc, children)):
+            return
+        pc.clear()
+        pc.extend(children)
 
-        if control.__uid in index:
-            del index[control.__uid]
+    def _remove_control_recursively(self, index, control):
+        stack = [control]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            c = pop()
+            extend(c._get_children())
+            uid = c._uid
+            if uid in index:
+                del index[uid]
 
     # private methods
     def get_cmd_str(self, indent=0, index=None, added_controls=None):
 
         # remove control from index
-        if self.__uid and index != None and self.__uid in index:
-            del index[self.__uid]
+        if self._uid and index != None and self._uid in index:
+            del index[self._uid]
 
         commands = []
 
         # main command
         command = self._get_cmd_attrs(False)
         command.indent = indent
-        command.values.append(self._get_control_name())
+        control_name = type(self)._control_name
+        if control_name is None:
+            control_name = self._get_control_name()
+        command.values.append(control_name)
         commands.append(command)
 
         if added_controls != None:
@@ -372,41 +602,51 @@ class Control:
             )
             commands.extend(childCmd)
 
-        self.__previous_children.clear()
-        self.__previous_children.extend(children)
+        self._set_previous_children(children)
 
         return commands
 
     def _get_cmd_attrs(self, update=False):
-        command = Command(0, None, [], {}, [], [])
+        command = acquire_command(0, None, [], {}, [], [])
 
-        if update and not self.__uid:
+        # nothing was changed since the last serialization
+        if update and (not self._uid or not self.__attrs_dirty):
             return command
 
-        for attrName in sorted(self.__attrs):
-            attrName = attrName.lower()
-            dirty = self.__attrs[attrName][1]
-
+        # work on a snapshot: other threads may set attributes meanwhile; the
+        # flag is cleared first so that such writes set it again
+        self.__attrs_dirty = False
+        attrs = self._attrs
+        snapshot = attrs.copy()
+
+        # attributes are serialized in name order; attributes are never removed,
+        # so the cached order is only rebuilt when new ones were added
+        names = self.__attr_names
+        if len(names) != len(snapshot):
+            names = self.__attr_names = sorted(snapshot)
+
+        for attrName in names:
+            t = snapshot[attrName]
+            val, dirty = t
             if (update and not dirty) or attrName == "id":
                 continue
 
-            val = self.__attrs[attrName][0]
-            sval = ""
             if val == None:
                 continue
-            elif isinstance(val, bool):
-                sval = str(val).lower()
-            elif isinstance(val, dt.datetime) or isinstance(val, dt.date):
-                sval = val.isoformat()
+            val_type = type(val)
+            if val_type is str:
+                sval = val
             else:
-                sval = str(val)
+                fmt = _FORMATTERS.get(val_type)
+                sval = fmt(val) if fmt is not None else _format_attr_value(val)
             command.attrs[attrName] = sval
-            self.__attrs[attrName] = (val, False)
+            if attrs.get(attrName) is t:
+                attrs[attrName] = (val, False)
 
-        id = self.__attrs.get("id")
+        id = self._attrs.get("id")
         if not update and id != None:
             command.attrs["id"] = id
         elif update and len(command.attrs) > 0:
-            command.values.append(self.__uid)
+            command.values.append(self._uid)
 
         return command
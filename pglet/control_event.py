@@ -2,8 +2,10 @@ from pglet.event import Event
 
 
 class ControlEvent(Event):
+    __slots__ = ("control", "page")
+
     def __init__(self, target, name, data, control, page):
-        Event.__init__(self, target=target, name=name, data=data)
+        Event.__init__(self, target, name, data)
 
         self.control = control
         self.page = page
@@ -82,7 +82,7 @@ class DatePicker(Control):
     # allow_text_input
     @property
     def allow_text_input(self):
-        return self._get_attr("allowTextInput", data_type="bool", def_value=False)
+        return self._get_bool_attr("allowTextInput", def_value=False)
 
     @allow_text_input.setter
     @beartype
@@ -92,7 +92,7 @@ class DatePicker(Control):
     # underlined
     @property
     def underlined(self):
-        return self._get_attr("underlined", data_type="bool", def_value=False)
+        return self._get_bool_attr("underlined", def_value=False)
 
     @underlined.setter
     @beartype
@@ -102,7 +102,7 @@ class DatePicker(Control):
     # borderless
     @property
     def borderless(self):
-        return self._get_attr("borderless", data_type="bool", def_value=False)
+        return self._get_bool_attr("borderless", def_value=False)
 
     @borderless.setter
     @beartype
@@ -112,7 +112,7 @@ class DatePicker(Control):
     # required
     @property
     def required(self):
-        return self._get_attr("required", data_type="bool", def_value=False)
+        return self._get_bool_attr("required", def_value=False)
 
     @required.setter
     @beartype
@@ -122,7 +122,7 @@ class DatePicker(Control):
     # focused
     @property
     def focused(self):
-        return self._get_attr("focused", data_type="bool", def_value=False)
+        return self._get_bool_attr("focused", def_value=False)
 
     @focused.setter
     @beartype
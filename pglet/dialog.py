@@ -95,7 +95,7 @@ class Dialog(Control):
     # open
     @property
     def open(self):
-        return self._get_attr("open", data_type="bool", def_value=False)
+        return self._get_bool_attr("open", def_value=False)
 
     @open.setter
     @beartype
@@ -133,7 +133,7 @@ class Dialog(Control):
     # auto_dismiss
     @property
     def auto_dismiss(self):
-        return self._get_attr("autoDismiss", data_type="bool", def_value=True)
+        return self._get_bool_attr("autoDismiss", def_value=True)
 
     @auto_dismiss.setter
     @beartype
@@ -152,7 +152,7 @@ class Dialog(Control):
     # fixed_top
     @property
     def fixed_top(self):
-        return self._get_attr("fixedTop", data_type="bool", def_value=False)
+        return self._get_bool_attr("fixedTop", def_value=False)
 
     @fixed_top.setter
     @beartype
@@ -162,7 +162,7 @@ class Dialog(Control):
     # blocking
     @property
     def blocking(self):
-        return self._get_attr("blocking", data_type="bool", def_value=False)
+        return self._get_bool_attr("blocking", def_value=False)
 
     @blocking.setter
     @beartype
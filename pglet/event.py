@@ -1,4 +1,6 @@
 class Event:
+    __slots__ = ("target", "name", "data")
+
     def __init__(self, target, name, data):
         self.target = target
         self.name = name
@@ -131,7 +131,7 @@ class Grid(Control):
     # compact
     @property
     def compact(self):
-        return self._get_attr("compact", data_type="bool", def_value=False)
+        return self._get_bool_attr("compact", def_value=False)
 
     @compact.setter
     @beartype
@@ -141,7 +141,7 @@ class Grid(Control):
     # header_visible
     @property
     def header_visible(self):
-        return self._get_attr("headerVisible", data_type="bool", def_value=True)
+        return self._get_bool_attr("headerVisible", def_value=True)
 
     @header_visible.setter
     @beartype
@@ -151,7 +151,7 @@ class Grid(Control):
     # preserve_selection
     @property
     def preserve_selection(self):
-        return self._get_attr("preserveSelection", data_type="bool", def_value=False)
+        return self._get_bool_attr("preserveSelection", def_value=False)
 
     @preserve_selection.setter
     @beartype
@@ -287,7 +287,7 @@ class Column(Control):
     # icon_only
     @property
     def icon_only(self):
-        return self._get_attr("iconOnly", data_type="bool", def_value=False)
+        return self._get_bool_attr("iconOnly", def_value=False)
 
     @icon_only.setter
     @beartype
@@ -335,7 +335,7 @@ class Column(Control):
     # resizable
     @property
     def resizable(self):
-        return self._get_attr("resizable", data_type="bool", def_value=False)
+        return self._get_bool_attr("resizable", def_value=False)
 
     @resizable.setter
     @beartype
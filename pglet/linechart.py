@@ -76,7 +76,7 @@ class LineChart(Control):
     # legend
     @property
     def legend(self):
-        return self._get_attr("legend", data_type="bool", def_value=False)
+        return self._get_bool_attr("legend", def_value=False)
 
     @legend.setter
     @beartype
@@ -86,7 +86,7 @@ class LineChart(Control):
     # tooltips
     @property
     def tooltips(self):
-        return self._get_attr("tooltips", data_type="bool", def_value=False)
+        return self._get_bool_attr("tooltips", def_value=False)
 
     @tooltips.setter
     @beartype
@@ -100,7 +100,7 @@ class Link(Control):
     # new_window
     @property
     def new_window(self):
-        return self._get_attr("newWindow", data_type="bool", def_value=False)
+        return self._get_bool_attr("newWindow", def_value=False)
 
     @new_window.setter
     @beartype
@@ -128,7 +128,7 @@ class Link(Control):
     # bold
     @property
     def bold(self):
-        return self._get_attr("bold", data_type="bool", def_value=False)
+        return self._get_bool_attr("bold", def_value=False)
 
     @bold.setter
     @beartype
@@ -138,7 +138,7 @@ class Link(Control):
     # italic
     @property
     def italic(self):
-        return self._get_attr("italic", data_type="bool", def_value=False)
+        return self._get_bool_attr("italic", def_value=False)
 
     @italic.setter
     @beartype
@@ -148,7 +148,7 @@ class Link(Control):
     # pre
     @property
     def pre(self):
-        return self._get_attr("pre", data_type="bool", def_value=False)
+        return self._get_bool_attr("pre", def_value=False)
 
     @pre.setter
     @beartype
@@ -103,7 +103,7 @@ class Message(Control):
     # multiline
     @property
     def multiline(self):
-        return self._get_attr("multiline", data_type="bool", def_value=False)
+        return self._get_bool_attr("multiline", def_value=False)
 
     @multiline.setter
     @beartype
@@ -113,7 +113,7 @@ class Message(Control):
     # truncated
     @property
     def truncated(self):
-        return self._get_attr("truncated", data_type="bool", def_value=False)
+        return self._get_bool_attr("truncated", def_value=False)
 
     @truncated.setter
     @beartype
@@ -123,7 +123,7 @@ class Message(Control):
     # dismiss
     @property
     def dismiss(self):
-        return self._get_attr("dismiss", data_type="bool", def_value=False)
+        return self._get_bool_attr("dismiss", def_value=False)
 
     @dismiss.setter
     @beartype
@@ -190,7 +190,7 @@ class Item(Control):
     # new_window
     @property
     def new_window(self):
-        return self._get_attr("newWindow", data_type="bool", def_value=False)
+        return self._get_bool_attr("newWindow", def_value=False)
 
     @new_window.setter
     @beartype
@@ -200,7 +200,7 @@ class Item(Control):
     # expanded
     @property
     def expanded(self):
-        return self._get_attr("expanded", data_type="bool", def_value=False)
+        return self._get_bool_attr("expanded", def_value=False)
 
     @expanded.setter
     @beartype
@@ -1,15 +1,15 @@
-import json
 import logging
 import threading
+from collections import deque
 
 from beartype import beartype
 from beartype.typing import List
 from beartype.typing import Optional
 from pglet import constants
 from pglet.connection import Connection
-from pglet.control import Control
+from pglet.control import Control, _AttrProp
 from pglet.control_event import ControlEvent
-from pglet.protocol import Command
+from pglet.protocol import Command, _json_loads, release_commands
 
 try:
     from typing import Literal
@@ -31,6 +31,28 @@ Align = Literal[
 
 THEME = Literal[None, "light", "dark"]
 
+# max number of events kept for wait_event()
+_EVENT_QUEUE_SIZE = 100
+
+_PAGE_DETAIL_KEYS = (
+    "hash",
+    "winwidth",
+    "winheight",
+    "userauthprovider",
+    "userid",
+    "userlogin",
+    "username",
+    "useremail",
+    "userclientip",
+)
+
+# read-only, shared by all sessions
+_FETCH_PAGE_COMMANDS = [
+    Command(0, "get", ["page", k], None, None, None) for k in _PAGE_DETAIL_KEYS
+]
+_SIGNOUT_COMMAND = Command(0, "signout", None, None, None, None)
+_CLEAN_PAGE_COMMAND = Command(0, "clean", ["page"], None, None, None)
+
 
 class Page(Control):
     def __init__(self, conn: Connection, session_id):
@@ -38,11 +60,15 @@ class Page(Control):
 
         self._conn = conn
         self._session_id = session_id
+        self._controls_lock = threading.Lock()  # guards page controls and attrs
+        self._send_lock = threading.Lock()  # serializes commands sent to the server
+        self._send_owner = None  # ident of the thread holding _send_lock
         self._controls = []  # page controls
-        self._index = {}  # index with all page controls
-        self._index[self.id] = self
-        self._last_event = None
-        self._event_available = threading.Event()
+        self._index = {self.id: self}  # index with all page controls
+        self._event_q = deque(maxlen=_EVENT_QUEUE_SIZE)
+        self._event_cv = threading.Condition()
+        self._win_width_cached = None
+        self._win_height_cached = None
         self._fetch_page_details()
 
     def __enter__(self):
@@ -59,44 +85,40 @@ class Page(Control):
 
     def _fetch_page_details(self):
         values = self._conn.send_commands(
-            self._conn.page_name,
-            self._session_id,
-            [
-                Command(0, "get", ["page", "hash"], None, None, None),
-                Command(0, "get", ["page", "winwidth"], None, None, None),
-                Command(0, "get", ["page", "winheight"], None, None, None),
-                Command(0, "get", ["page", "userauthprovider"], None, None, None),
-                Command(0, "get", ["page", "userid"], None, None, None),
-                Command(0, "get", ["page", "userlogin"], None, None, None),
-                Command(0, "get", ["page", "username"], None, None, None),
-                Command(0, "get", ["page", "useremail"], None, None, None),
-                Command(0, "get", ["page", "userclientip"], None, None, None),
-            ],
+            self._conn.page_name, self._session_id, _FETCH_PAGE_COMMANDS
         ).results
-        self._set_attr("hash", values[0], False)
-        self._set_attr("winwidth", values[1], False)
-        self._set_attr("winheight", values[2], False)
-        self._set_attr("userauthprovider", values[3], False)
-        self._set_attr("userid", values[4], False)
-        self._set_attr("userlogin", values[5], False)
-        self._set_attr("username", values[6], False)
-        self._set_attr("useremail", values[7], False)
-        self._set_attr("userclientip", values[8], False)
+        for name, value in zip(_PAGE_DETAIL_KEYS, values):
+            self._set_attr(name, value, False)
 
     def update(self, *controls):
-        with self._lock:
-            if len(controls) == 0:
-                return self.__update(self)
-            else:
-                return self.__update(*controls)
+        if len(controls) == 0:
+            return self.__update(self)
+        else:
+            return self.__update(*controls)
+
+    def __with_send_lock(self, fn, *args):
+        # _send_lock is not reentrant; a thread that already holds it runs fn directly
+        tid = threading.get_ident()
+        if self._send_owner == tid:
+            return fn(*args)
+        with self._send_lock:
+            self._send_owner = tid
+            try:
+                return fn(*args)
+            finally:
+                self._send_owner = None
 
     def __update(self, *controls):
+        return self.__with_send_lock(self.__send_update, controls)
+
+    def __send_update(self, controls):
         added_controls = []
         commands = []
 
         # build commands
-        for control in controls:
-            control.build_update_commands(self._index, added_controls, commands)
+        with self._controls_lock:
+            for control in controls:
+                control.build_update_commands(self._index, added_controls, commands)
 
         if len(commands) == 0:
             return
@@ -105,91 +127,135 @@ class Page(Control):
         results = self._conn.send_commands(
             self._conn.page_name, self._session_id, commands
         ).results
+        release_commands(commands)
 
-        if len(results) > 0:
-            n = 0
+        # results only carry ids of added controls
+        if added_controls and results:
+            new_entries = {}
+            ids_iter = iter(added_controls)
             for line in results:
                 for id in line.split(" "):
-                    added_controls[n]._Control__uid = id
-                    added_controls[n].page = self
+                    c = next(ids_iter)
+                    c._uid = id
+                    c.page = self
+                    new_entries[id] = c
 
-                    # add to index
-                    self._index[id] = added_controls[n]
-                    n += 1
+            # add to index
+            self._index.update(new_entries)
 
     def add(self, *controls):
-        with self._lock:
+        with self._controls_lock:
             self._controls.extend(controls)
-            return self.__update(self)
+        return self.__update(self)
 
     def insert(self, at, *controls):
-        with self._lock:
+        with self._controls_lock:
             n = at
             for control in controls:
                 self._controls.insert(n, control)
                 n += 1
-            return self.__update(self)
+        return self.__update(self)
 
     def remove(self, *controls):
-        with self._lock:
-            for control in controls:
-                self._controls.remove(control)
-            return self.__update(self)
+        with self._controls_lock:
+            if len(controls) == 1:
+                self._controls.remove(controls[0])
+            else:
+                # single pass over page controls instead of one scan per removed
+                # control; like repeated list.remove(), each argument removes the
+                # first remaining occurrence of that control
+                pending = {}
+                for c in controls:
+                    pending[id(c)] = pending.get(id(c), 0) + 1
+                remaining = []
+                for c in self._controls:
+                    n = pending.get(id(c))
+                    if n:
+                        pending[id(c)] = n - 1
+                    else:
+                        remaining.append(c)
+                if any(pending.values()):
+                    raise ValueError("list.remove(x): x not in list")
+                self._controls[:] = remaining
+        return self.__update(self)
 
     def remove_at(self, index):
-        with self._lock:
+        with self._controls_lock:
             self._controls.pop(index)
-            return self.__update(self)
+        return self.__update(self)
 
     def clean(self):
-        with self._lock:
+        return self.__with_send_lock(self.__clean)
+
+    def __clean(self):
+        with self._controls_lock:
             self._previous_children.clear()
             for child in self._get_children():
                 self._remove_control_recursively(self._index, child)
             self._controls.clear()
-            return self._send_command("clean", [self.uid])
+        return self._conn.send_command(
+            self._conn.page_name, self._session_id, _CLEAN_PAGE_COMMAND
+        )
 
     def error(self, message=""):
-        with self._lock:
-            self._send_command("error", [message])
+        self.__with_send_lock(self._send_command, "error", [message])
 
     def on_event(self, e):
         logging.info(f"page.on_event: {e.target} {e.name} {e.data}")
 
-        with self._lock:
-            if e.target == "page" and e.name == "change":
-                for props in json.loads(e.data):
-                    id = props["i"]
-                    if id in self._index:
-                        for name in props:
-                            if name != "i":
-                                self._index[id]._set_attr(
-                                    name, props[name], dirty=False
-                                )
-
-            elif e.target in self._index:
-                self._last_event = ControlEvent(
-                    e.target, e.name, e.data, self._index[e.target], self
-                )
-                handler = self._index[e.target].event_handlers.get(e.name)
-                if handler:
-                    t = threading.Thread(
-                        target=handler, args=(self._last_event,), daemon=True
-                    )
-                    t.start()
-                self._event_available.set()
-
+        if e.target == "page" and e.name == "change":
+            for props in _json_loads(e.data):
+                # single-key dict reads don't need a lock
+                ctrl = self._index.get(props.pop("i"))
+                if ctrl is not None:
+                    with self._controls_lock:
+                        ctrl._set_attrs(props, dirty=False)
+                    if ctrl is self:
+                        # page size may have changed
+                        self._win_width_cached = None
+                        self._win_height_cached = None
+
+        else:
+            ctrl = self._index.get(e.target)
+            if ctrl is None:
+                return
+            ce = ControlEvent(e.target, e.name, e.data, ctrl, self)
+            handler = ctrl.event_handlers.get(e.name)
+            if handler:
+                # daemon threads: a long-running handler must neither block other
+                # sessions' events nor keep the process alive on exit
+                threading.Thread(target=handler, args=(ce,), daemon=True).start()
+            with self._event_cv:
+                self._event_q.append(ce)
+                self._event_cv.notify()
+
+    # returns the oldest queued control event, waiting for one if the queue is
+    # empty. All control events are queued, including those passed to a handler,
+    # and only the last _EVENT_QUEUE_SIZE are kept (with references to their
+    # controls); call clear_events() first to wait for events that happen after
+    # the call only.
     def wait_event(self):
-        self._event_available.clear()
-        self._event_available.wait()
-        return self._last_event
+        with self._event_cv:
+            while not self._event_q:
+                self._event_cv.wait()
+            return self._event_q.popleft()
+
+    def clear_events(self):
+        with self._event_cv:
+            self._event_q.clear()
 
     def show_signin(self, auth_providers="*", auth_groups=False, allow_dismiss=False):
-        with self._lock:
-            self.signin = auth_providers
-            self.signin_groups = auth_groups
-            self.signin_allow_dismiss = allow_dismiss
-            self.__update(self)
+        with self._controls_lock:
+            self._set_attrs(
+                {
+                    "signin": auth_providers,
+                    "signinGroups": auth_groups,
+                    "signinAllowDismiss": allow_dismiss,
+                }
+            )
+        # only sign-in events that follow this request count
+        self.clear_events()
+        self.__update(self)
 
         while True:
             e = self.wait_event()
@@ -199,7 +265,9 @@ class Page(Control):
                 return False
 
     def signout(self):
-        return self._send_command("signout", None)
+        return self._conn.send_command(
+            self._conn.page_name, self._session_id, _SIGNOUT_COMMAND
+        )
 
     def can_access(self, users_and_groups):
         return (
@@ -252,18 +320,12 @@ class Page(Control):
         self._controls = value
 
     # title
-    @property
-    def title(self):
-        return self._get_attr("title")
-
-    @title.setter
-    def title(self, value):
-        self._set_attr("title", value)
+    title = _AttrProp("title")
 
     # vertical_fill
     @property
     def vertical_fill(self):
-        return self._get_attr("verticalFill", data_type="bool", def_value=False)
+        return self._get_bool_attr("verticalFill", def_value=False)
 
     @vertical_fill.setter
     @beartype
@@ -301,22 +363,10 @@ class Page(Control):
         self._set_attr("gap", value)
 
     # padding
-    @property
-    def padding(self):
-        return self._get_attr("padding")
-
-    @padding.setter
-    def padding(self, value):
-        self._set_attr("padding", value)
+    padding = _AttrProp("padding")
 
     # bgcolor
-    @property
-    def bgcolor(self):
-        return self._get_attr("bgcolor")
-
-    @bgcolor.setter
-    def bgcolor(self, value):
-        self._set_attr("bgcolor", value)
+    bgcolor = _AttrProp("bgcolor")
 
     # theme
     @property
@@ -329,70 +379,40 @@ class Page(Control):
         self._set_attr("theme", value)
 
     # theme_primary_color
-    @property
-    def theme_primary_color(self):
-        return self._get_attr("themePrimaryColor")
-
-    @theme_primary_color.setter
-    def theme_primary_color(self, value):
-        self._set_attr("themePrimaryColor", value)
+    theme_primary_color = _AttrProp("themePrimaryColor")
 
     # theme_text_color
-    @property
-    def theme_text_color(self):
-        return self._get_attr("themeTextColor")
-
-    @theme_text_color.setter
-    def theme_text_color(self, value):
-        self._set_attr("themeTextColor", value)
+    theme_text_color = _AttrProp("themeTextColor")
 
     # theme_background_color
-    @property
-    def theme_background_color(self):
-        return self._get_attr("themeBackgroundColor")
-
-    @theme_background_color.setter
-    def theme_background_color(self, value):
-        self._set_attr("themeBackgroundColor", value)
+    theme_background_color = _AttrProp("themeBackgroundColor")
 
     # hash
-    @property
-    def hash(self):
-        return self._get_attr("hash")
-
-    @hash.setter
-    def hash(self, value):
-        self._set_attr("hash", value)
+    hash = _AttrProp("hash")
 
     # win_width
     @property
     def win_width(self):
-        w = self._get_attr("winwidth")
-        if w != None and w != "":
-            return int(w)
-        return 0
+        if self._win_width_cached is None:
+            w = self._get_attr("winwidth")
+            self._win_width_cached = int(w) if w != None and w != "" else 0
+        return self._win_width_cached
 
     # win_height
     @property
     def win_height(self):
-        h = self._get_attr("winheight")
-        if h != None and h != "":
-            return int(h)
-        return 0
+        if self._win_height_cached is None:
+            h = self._get_attr("winheight")
+            self._win_height_cached = int(h) if h != None and h != "" else 0
+        return self._win_height_cached
 
     # signin
-    @property
-    def signin(self):
-        return self._get_attr("signin")
-
-    @signin.setter
-    def signin(self, value):
-        self._set_attr("signin", value)
+    signin = _AttrProp("signin")
 
     # signin_allow_dismiss
     @property
     def signin_allow_dismiss(self):
-        return self._get_attr("signinAllowDismiss", data_type="bool", def_value=False)
+        return self._get_bool_attr("signinAllowDismiss", def_value=False)
 
     @signin_allow_dismiss.setter
     @beartype
@@ -402,7 +422,7 @@ class Page(Control):
     # signin_groups
     @property
     def signin_groups(self):
-        return self._get_attr("signinGroups", data_type="bool", def_value=False)
+        return self._get_bool_attr("signinGroups", def_value=False)
 
     @signin_groups.setter
     @beartype
@@ -410,34 +430,22 @@ class Page(Control):
         self._set_attr("signinGroups", value)
 
     # user_auth_provider
-    @property
-    def user_auth_provider(self):
-        return self._get_attr("userauthprovider")
+    user_auth_provider = _AttrProp("userauthprovider", readonly=True)
 
     # user_id
-    @property
-    def user_id(self):
-        return self._get_attr("userId")
+    user_id = _AttrProp("userId", readonly=True)
 
     # user_login
-    @property
-    def user_login(self):
-        return self._get_attr("userLogin")
+    user_login = _AttrProp("userLogin", readonly=True)
 
     # user_name
-    @property
-    def user_name(self):
-        return self._get_attr("userName")
+    user_name = _AttrProp("userName", readonly=True)
 
     # user_email
-    @property
-    def user_email(self):
-        return self._get_attr("userEmail")
+    user_email = _AttrProp("userEmail", readonly=True)
 
     # user_client_ip
-    @property
-    def user_client_ip(self):
-        return self._get_attr("userClientIP")
+    user_client_ip = _AttrProp("userClientIP", readonly=True)
 
     # on_signin
     @property
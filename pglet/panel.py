@@ -103,7 +103,7 @@ class Panel(Control):
     # open
     @property
     def open(self):
-        return self._get_attr("open", data_type="bool", def_value=False)
+        return self._get_bool_attr("open", def_value=False)
 
     @open.setter
     @beartype
@@ -132,7 +132,7 @@ class Panel(Control):
     # auto_dismiss
     @property
     def auto_dismiss(self):
-        return self._get_attr("autoDismiss", data_type="bool", def_value=True)
+        return self._get_bool_attr("autoDismiss", def_value=True)
 
     @auto_dismiss.setter
     @beartype
@@ -142,7 +142,7 @@ class Panel(Control):
     # light_dismiss
     @property
     def light_dismiss(self):
-        return self._get_attr("lightDismiss", data_type="bool", def_value=False)
+        return self._get_bool_attr("lightDismiss", def_value=False)
 
     @light_dismiss.setter
     @beartype
@@ -161,7 +161,7 @@ class Panel(Control):
     # blocking
     @property
     def blocking(self):
-        return self._get_attr("blocking", data_type="bool", def_value=False)
+        return self._get_bool_attr("blocking", def_value=False)
 
     @blocking.setter
     @beartype
@@ -173,7 +173,7 @@ class Persona(Control):
     # hide_details
     @property
     def hide_details(self):
-        return self._get_attr("hidedetails", data_type="bool", def_value=False)
+        return self._get_bool_attr("hidedetails", def_value=False)
 
     @hide_details.setter
     @beartype
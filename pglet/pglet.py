@@ -1,6 +1,7 @@
 import logging
 import os
 import signal
+import subprocess
 import tarfile
 import tempfile
 import threading
@@ -1,8 +1,16 @@
-from dataclasses import dataclass, field
+import json
+import os
+import sys
+from dataclasses import dataclass
+from functools import partial
 from typing import Dict, List
 from typing import Optional
 
 
+# slotted dataclasses need Python 3.10+
+_dataclass = dataclass if sys.version_info < (3, 10) else partial(dataclass, slots=True)
+
+
 class Actions:
     REGISTER_HOST_CLIENT = "registerHostClient"
     SESSION_CREATED = "sessionCreated"
@@ -11,50 +19,123 @@ class Actions:
     PAGE_EVENT_TO_HOST = "pageEventToHost"
 
 
-@dataclass
-class Command:
-    indent: int
-    name: Optional[str]
-    values: List[str] = field(default_factory=list)
-    attrs: Dict[str, str] = field(default_factory=dict)
-    lines: List[str] = field(default_factory=list)
-    commands: List[any] = field(default_factory=list)
+_EMPTY = object()
 
 
-@dataclass
+class Command:
+    # plain slotted class: the most frequently created protocol object,
+    # cheaper to construct than a dataclass
+    __slots__ = ("indent", "name", "values", "attrs", "lines", "commands")
+
+    def __init__(
+        self,
+        indent: int,
+        name: Optional[str],
+        values: List[str] = _EMPTY,
+        attrs: Dict[str, str] = _EMPTY,
+        lines: List[str] = _EMPTY,
+        commands: List[any] = _EMPTY,
+    ):
+        self.indent = indent
+        self.name = name
+        self.values = [] if values is _EMPTY else values
+        self.attrs = {} if attrs is _EMPTY else attrs
+        self.lines = [] if lines is _EMPTY else lines
+        self.commands = [] if commands is _EMPTY else commands
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.indent == other.indent
+            and self.name == other.name
+            and self.values == other.values
+            and self.attrs == other.attrs
+            and self.lines == other.lines
+            and self.commands == other.commands
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (
+            f"Command(indent={self.indent!r}, name={self.name!r}, "
+            f"values={self.values!r}, attrs={self.attrs!r}, "
+            f"lines={self.lines!r}, commands={self.commands!r})"
+        )
+
+
+# free-list of Command objects; recycling is opt-in (PGLET_POOL_COMMANDS=1, read
+# once at import) as it only pays off for pages sending updates at a high rate.
+# The list is capped so that one large render doesn't pin its commands for good.
+_command_pool = []
+_COMMAND_POOL_SIZE = 1024
+_pool_commands = os.environ.get("PGLET_POOL_COMMANDS", "").lower() in ("1", "true")
+
+
+def acquire_command(indent, name, values, attrs, lines, commands):
+    if _pool_commands:
+        try:
+            cmd = _command_pool.pop()
+        except IndexError:
+            pass
+        else:
+            cmd.indent = indent
+            cmd.name = name
+            cmd.values = values
+            cmd.attrs = attrs
+            cmd.lines = lines
+            cmd.commands = commands
+            return cmd
+    return Command(indent, name, values, attrs, lines, commands)
+
+
+def release_commands(commands):
+    if not _pool_commands:
+        return
+    stack = list(commands)
+    while stack and len(_command_pool) < _COMMAND_POOL_SIZE:
+        cmd = stack.pop()
+        if cmd.commands:
+            stack.extend(cmd.commands)
+        cmd.values = cmd.attrs = cmd.lines = cmd.commands = None
+        _command_pool.append(cmd)
+
+
+@_dataclass
 class Message:
     id: str
     action: str
     payload: any
 
 
-@dataclass
+@_dataclass
 class PageCommandRequestPayload:
     pageName: str
     sessionID: str
     command: Command
 
 
-@dataclass
+@_dataclass
 class PageCommandResponsePayload:
     result: str
     error: str
 
 
-@dataclass
+@_dataclass
 class PageCommandsBatchRequestPayload:
     pageName: str
     sessionID: str
     commands: List[Command]
 
 
-@dataclass
+@_dataclass
 class PageCommandsBatchResponsePayload:
     results: List[str]
     error: str
 
 
-@dataclass
+@_dataclass
 class PageEventPayload:
     pageName: str
     sessionID: str
@@ -63,7 +144,7 @@ class PageEventPayload:
     eventData: str
 
 
-@dataclass
+@_dataclass
 class RegisterHostClientRequestPayload:
     hostClientID: str
     pageName: str
@@ -73,7 +154,7 @@ class RegisterHostClientRequestPayload:
     permissions: str
 
 
-@dataclass
+@_dataclass
 class RegisterHostClientResponsePayload:
     hostClientID: str
     pageName: str
@@ -81,7 +162,35 @@ class RegisterHostClientResponsePayload:
     error: str
 
 
-@dataclass
+@_dataclass
 class PageSessionCreatedPayload:
     pageName: str
     sessionID: str
+
+
+def _json_default(o):
+    # protocol objects may be slotted and have no __dict__ for vars()
+    names = getattr(o, "__dataclass_fields__", None)
+    if names is None:
+        names = o.__slots__
+    return {name: getattr(o, name) for name in names}
+
+
+def _json_dumps_stdlib(obj):
+    return json.dumps(obj, default=_json_default)
+
+
+try:
+    import msgspec
+
+    # optional: pip install pglet[fast]; encodes protocol dataclasses natively,
+    # Command through _json_default
+    _json_encoder = msgspec.json.Encoder(enc_hook=_json_default)
+
+    def _json_dumps(obj):
+        return _json_encoder.encode(obj).decode("utf-8")
+
+    _json_loads = msgspec.json.decode
+except ImportError:
+    _json_dumps = _json_dumps_stdlib
+    _json_loads = json.loads
@@ -110,7 +110,7 @@ class SearchBox(Control):
     # underlined
     @property
     def underlined(self):
-        return self._get_attr("underlined", data_type="bool", def_value=False)
+        return self._get_bool_attr("underlined", def_value=False)
 
     @underlined.setter
     @beartype
@@ -138,7 +138,7 @@ class SearchBox(Control):
     # focused
     @property
     def focused(self):
-        return self._get_attr("focused", data_type="bool", def_value=False)
+        return self._get_bool_attr("focused", def_value=False)
 
     @focused.setter
     @beartype
@@ -70,7 +70,7 @@ class Slider(Control):
     # value
     @property
     def value(self):
-        return self._get_attr("value", data_type="float")
+        return self._get_float_attr("value")
 
     @value.setter
     @beartype
@@ -119,7 +119,7 @@ class Slider(Control):
     # show_value
     @property
     def show_value(self):
-        return self._get_attr("showValue", data_type="bool", def_value=False)
+        return self._get_bool_attr("showValue", def_value=False)
 
     @show_value.setter
     @beartype
@@ -138,7 +138,7 @@ class Slider(Control):
     # vertical
     @property
     def vertical(self):
-        return self._get_attr("vertical", data_type="bool", def_value=False)
+        return self._get_bool_attr("vertical", def_value=False)
 
     @vertical.setter
     @beartype
@@ -148,7 +148,7 @@ class Slider(Control):
     # focused
     @property
     def focused(self):
-        return self._get_attr("focused", data_type="bool", def_value=False)
+        return self._get_bool_attr("focused", def_value=False)
 
     @focused.setter
     @beartype
@@ -2,7 +2,7 @@ from typing import Optional, Union
 
 from beartype import beartype
 
-from pglet.control import Control
+from pglet.control import Control, _AttrProp, _parse_bool
 
 try:
     from typing import Literal
@@ -12,20 +12,24 @@ except:
 
 Position = Literal[None, "left", "top", "right", "bottom"]
 
+_NUMBER = (int, float)
+
 
 class SpinButton(Control):
+    # attrs are validated once by __init__ and set in one batch
+    @beartype
     def __init__(
         self,
         label=None,
         id=None,
         ref=None,
-        value=None,
-        min=None,
-        max=None,
-        step=None,
+        value: Union[None, int, float] = None,
+        min: Union[None, int, float] = None,
+        max: Union[None, int, float] = None,
+        step: Union[None, int, float] = None,
         icon=None,
         label_position: Position = None,
-        focused=None,
+        focused: Optional[bool] = None,
         data=None,
         on_change=None,
         on_focus=None,
@@ -49,14 +53,18 @@ class SpinButton(Control):
             disabled=disabled,
             data=data,
         )
-        self.value = value
-        self.label = label
-        self.label_position = label_position
-        self.min = min
-        self.max = max
-        self.step = step
-        self.icon = icon
-        self.focused = focused
+        self._set_attrs(
+            {
+                "value": value,
+                "label": label,
+                "labelposition": label_position,
+                "min": min,
+                "max": max,
+                "step": step,
+                "icon": icon,
+                "focused": focused,
+            }
+        )
         self.on_change = on_change
         self.on_focus = on_focus
         self.on_blur = on_blur
@@ -74,23 +82,10 @@ class SpinButton(Control):
         self._add_event_handler("change", handler)
 
     # value
-    @property
-    def value(self):
-        return self._get_attr("value", data_type="float")
-
-    @value.setter
-    @beartype
-    def value(self, value: Union[None, int, float]):
-        self._set_attr("value", value)
+    value = _AttrProp("value", types=_NUMBER, cast=float)
 
     # label
-    @property
-    def label(self):
-        return self._get_attr("label")
-
-    @label.setter
-    def label(self, value):
-        self._set_attr("label", value)
+    label = _AttrProp("label")
 
     # label_position
     @property
@@ -103,53 +98,19 @@ class SpinButton(Control):
         self._set_attr("labelposition", value)
 
     # min
-    @property
-    def min(self):
-        return self._get_attr("min")
-
-    @min.setter
-    @beartype
-    def min(self, value: Union[None, int, float]):
-        self._set_attr("min", value)
+    min = _AttrProp("min", types=_NUMBER)
 
     # max
-    @property
-    def max(self):
-        return self._get_attr("max")
-
-    @max.setter
-    @beartype
-    def max(self, value: Union[None, int, float]):
-        self._set_attr("max", value)
+    max = _AttrProp("max", types=_NUMBER)
 
     # step
-    @property
-    def step(self):
-        return self._get_attr("step")
-
-    @step.setter
-    @beartype
-    def step(self, value: Union[None, int, float]):
-        self._set_attr("step", value)
+    step = _AttrProp("step", types=_NUMBER)
 
     # icon
-    @property
-    def icon(self):
-        return self._get_attr("icon")
-
-    @icon.setter
-    def icon(self, value):
-        self._set_attr("icon", value)
+    icon = _AttrProp("icon")
 
     # focused
-    @property
-    def focused(self):
-        return self._get_attr("focused", data_type="bool", def_value=False)
-
-    @focused.setter
-    @beartype
-    def focused(self, value: Optional[bool]):
-        self._set_attr("focused", value)
+    focused = _AttrProp("focused", def_value=False, types=(bool,), cast=_parse_bool)
 
     # on_focus
     @property
@@ -70,7 +70,7 @@ class SplitStack(Control):
     # horizontal
     @property
     def horizontal(self):
-        return self._get_attr("horizontal", data_type="bool", def_value=False)
+        return self._get_bool_attr("horizontal", def_value=False)
 
     @horizontal.setter
     @beartype
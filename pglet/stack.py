@@ -116,7 +116,7 @@ class Stack(Control):
     # horizontal
     @property
     def horizontal(self):
-        return self._get_attr("horizontal", data_type="bool", def_value=False)
+        return self._get_bool_attr("horizontal", def_value=False)
 
     @horizontal.setter
     @beartype
@@ -126,7 +126,7 @@ class Stack(Control):
     # vertical_fill
     @property
     def vertical_fill(self):
-        return self._get_attr("verticalFill", data_type="bool", def_value=False)
+        return self._get_bool_attr("verticalFill", def_value=False)
 
     @vertical_fill.setter
     @beartype
@@ -201,7 +201,7 @@ class Stack(Control):
     # wrap
     @property
     def wrap(self):
-        return self._get_attr("wrap", data_type="bool", def_value=False)
+        return self._get_bool_attr("wrap", def_value=False)
 
     @wrap.setter
     @beartype
@@ -260,7 +260,7 @@ class Stack(Control):
     # scroll_x
     @property
     def scroll_x(self):
-        return self._get_attr("scrollx", data_type="bool", def_value=False)
+        return self._get_bool_attr("scrollx", def_value=False)
 
     @scroll_x.setter
     @beartype
@@ -270,7 +270,7 @@ class Stack(Control):
     # scroll_y
     @property
     def scroll_y(self):
-        return self._get_attr("scrolly", data_type="bool", def_value=False)
+        return self._get_bool_attr("scrolly", def_value=False)
 
     @scroll_y.setter
     @beartype
@@ -280,7 +280,7 @@ class Stack(Control):
     # auto_scroll
     @property
     def auto_scroll(self):
-        return self._get_attr("autoscroll", data_type="bool", def_value=False)
+        return self._get_bool_attr("autoscroll", def_value=False)
 
     @auto_scroll.setter
     @beartype
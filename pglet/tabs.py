@@ -90,7 +90,7 @@ class Tabs(Control):
     # solid
     @property
     def solid(self):
-        return self._get_attr("solid", data_type="bool", def_value=False)
+        return self._get_bool_attr("solid", def_value=False)
 
     @solid.setter
     @beartype
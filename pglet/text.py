@@ -91,7 +91,7 @@ class Text(Control):
     # markdown
     @property
     def markdown(self):
-        return self._get_attr("markdown", data_type="bool", def_value=False)
+        return self._get_bool_attr("markdown", def_value=False)
 
     @markdown.setter
     @beartype
@@ -131,7 +131,7 @@ class Text(Control):
     # bold
     @property
     def bold(self):
-        return self._get_attr("bold", data_type="bool", def_value=False)
+        return self._get_bool_attr("bold", def_value=False)
 
     @bold.setter
     @beartype
@@ -141,7 +141,7 @@ class Text(Control):
     # italic
     @property
     def italic(self):
-        return self._get_attr("italic", data_type="bool", def_value=False)
+        return self._get_bool_attr("italic", def_value=False)
 
     @italic.setter
     @beartype
@@ -151,7 +151,7 @@ class Text(Control):
     # pre
     @property
     def pre(self):
-        return self._get_attr("pre", data_type="bool", def_value=False)
+        return self._get_bool_attr("pre", def_value=False)
 
     @pre.setter
     @beartype
@@ -161,7 +161,7 @@ class Text(Control):
     # nowrap
     @property
     def nowrap(self):
-        return self._get_attr("nowrap", data_type="bool", def_value=False)
+        return self._get_bool_attr("nowrap", def_value=False)
 
     @nowrap.setter
     @beartype
@@ -171,7 +171,7 @@ class Text(Control):
     # block
     @property
     def block(self):
-        return self._get_attr("block", data_type="bool", def_value=False)
+        return self._get_bool_attr("block", def_value=False)
 
     @block.setter
     @beartype
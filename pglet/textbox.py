@@ -174,7 +174,7 @@ class Textbox(Control):
     # multiline
     @property
     def multiline(self):
-        return self._get_attr("multiline", data_type="bool", def_value=False)
+        return self._get_bool_attr("multiline", def_value=False)
 
     @multiline.setter
     @beartype
@@ -194,7 +194,7 @@ class Textbox(Control):
     # shift_enter
     @property
     def shift_enter(self):
-        return self._get_attr("shiftenter", data_type="bool", def_value=False)
+        return self._get_bool_attr("shiftenter", def_value=False)
 
     @shift_enter.setter
     @beartype
@@ -204,7 +204,7 @@ class Textbox(Control):
     # read_only
     @property
     def read_only(self):
-        return self._get_attr("readOnly", data_type="bool", def_value=False)
+        return self._get_bool_attr("readOnly", def_value=False)
 
     @read_only.setter
     @beartype
@@ -214,7 +214,7 @@ class Textbox(Control):
     # auto_adjust_height
     @property
     def auto_adjust_height(self):
-        return self._get_attr("autoadjustheight", data_type="bool", def_value=False)
+        return self._get_bool_attr("autoadjustheight", def_value=False)
 
     @auto_adjust_height.setter
     @beartype
@@ -224,7 +224,7 @@ class Textbox(Control):
     # resizable
     @property
     def resizable(self):
-        return self._get_attr("resizable", data_type="bool", def_value=True)
+        return self._get_bool_attr("resizable", def_value=True)
 
     @resizable.setter
     @beartype
@@ -234,7 +234,7 @@ class Textbox(Control):
     # underlined
     @property
     def underlined(self):
-        return self._get_attr("underlined", data_type="bool", def_value=False)
+        return self._get_bool_attr("underlined", def_value=False)
 
     @underlined.setter
     @beartype
@@ -244,7 +244,7 @@ class Textbox(Control):
     # borderless
     @property
     def borderless(self):
-        return self._get_attr("borderless", data_type="bool", def_value=False)
+        return self._get_bool_attr("borderless", def_value=False)
 
     @borderless.setter
     @beartype
@@ -254,7 +254,7 @@ class Textbox(Control):
     # password
     @property
     def password(self):
-        return self._get_attr("password", data_type="bool", def_value=False)
+        return self._get_bool_attr("password", def_value=False)
 
     @password.setter
     @beartype
@@ -264,7 +264,7 @@ class Textbox(Control):
     # required
     @property
     def required(self):
-        return self._get_attr("required", data_type="bool", def_value=False)
+        return self._get_bool_attr("required", def_value=False)
 
     @required.setter
     @beartype
@@ -274,7 +274,7 @@ class Textbox(Control):
     # focused
     @property
     def focused(self):
-        return self._get_attr("focused", data_type="bool", def_value=False)
+        return self._get_bool_attr("focused", def_value=False)
 
     @focused.setter
     @beartype
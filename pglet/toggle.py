@@ -68,7 +68,7 @@ class Toggle(Control):
     # value
     @property
     def value(self):
-        return self._get_attr("value", data_type="bool", def_value=False)
+        return self._get_bool_attr("value", def_value=False)
 
     @value.setter
     @beartype
@@ -97,7 +97,7 @@ class Toggle(Control):
     # inline
     @property
     def inline(self):
-        return self._get_attr("inline", data_type="bool", def_value=False)
+        return self._get_bool_attr("inline", def_value=False)
 
     @inline.setter
     @beartype
@@ -125,7 +125,7 @@ class Toggle(Control):
     # focused
     @property
     def focused(self):
-        return self._get_attr("focused", data_type="bool", def_value=False)
+        return self._get_bool_attr("focused", def_value=False)
 
     @focused.setter
     @beartype
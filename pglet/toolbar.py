@@ -48,7 +48,7 @@ class Toolbar(Control):
     # inverted
     @property
     def inverted(self):
-        return self._get_attr("inverted", data_type="bool", def_value=False)
+        return self._get_bool_attr("inverted", def_value=False)
 
     @inverted.setter
     @beartype
@@ -232,7 +232,7 @@ class Item(Control):
     # new_window
     @property
     def new_window(self):
-        return self._get_attr("newWindow", data_type="bool", def_value=False)
+        return self._get_bool_attr("newWindow", def_value=False)
 
     @new_window.setter
     @beartype
@@ -260,7 +260,7 @@ class Item(Control):
     # icon_only
     @property
     def icon_only(self):
-        return self._get_attr("iconOnly", data_type="bool", def_value=False)
+        return self._get_bool_attr("iconOnly", def_value=False)
 
     @icon_only.setter
     @beartype
@@ -270,7 +270,7 @@ class Item(Control):
     # split
     @property
     def split(self):
-        return self._get_attr("split", data_type="bool", def_value=False)
+        return self._get_bool_attr("split", def_value=False)
 
     @split.setter
     @beartype
@@ -280,7 +280,7 @@ class Item(Control):
     # divider
     @property
     def divider(self):
-        return self._get_attr("divider", data_type="bool", def_value=False)
+        return self._get_bool_attr("divider", def_value=False)
 
     @divider.setter
     @beartype
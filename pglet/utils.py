@@ -1,15 +1,21 @@
+import functools
 import platform
-import subprocess
+import shutil
+import webbrowser
+from urllib.parse import urlsplit
 
 
+@functools.lru_cache(maxsize=1)
 def is_windows():
     return platform.system() == "Windows"
 
 
+@functools.lru_cache(maxsize=1)
 def is_macos():
     return platform.system() == "Darwin"
 
 
+@functools.lru_cache(maxsize=1)
 def get_platform():
     p = platform.system()
     if is_windows():
@@ -22,6 +28,7 @@ def get_platform():
         raise Exception(f"Unsupported platform: {p}")
 
 
+@functools.lru_cache(maxsize=1)
 def get_arch():
     a = platform.machine().lower()
     if a == "x86_64" or a == "amd64":
@@ -35,31 +42,17 @@ def get_arch():
 
 
 def open_in_browser(url):
-    if is_windows():
-        subprocess.run(["explorer.exe", url])
-    elif is_macos():
-        subprocess.run(["open", url])
+    # not on Linux, where pglet often runs headless and webbrowser may fall back to a console browser
+    if is_windows() or is_macos():
+        webbrowser.open(url, new=2)
 
 
-# https://stackoverflow.com/questions/377017/test-if-executable-exists-in-python
 def which(program):
-    import os
-
-    def is_exe(fpath):
-        return os.path.isfile(fpath) and os.access(fpath, os.X_OK)
+    return shutil.which(program)
 
-    fpath, _ = os.path.split(program)
-    if fpath:
-        if is_exe(program):
-            return program
-    else:
-        for path in os.environ["PATH"].split(os.pathsep):
-            exe_file = os.path.join(path, program)
-            if is_exe(exe_file):
-                return exe_file
 
-    return None
+_LOCALHOST_NAMES = frozenset(("localhost", "127.0.0.1", "::1"))
 
 
 def is_localhost_url(url):
-    return "://localhost/" in url or "://localhost:" in url
+    return urlsplit(url).hostname in _LOCALHOST_NAMES
@@ -0,0 +1,231 @@
+from pglet import Stack, Text
+from pglet.protocol import Command
+
+
+def _add_to_index(control, index, uids):
+    added_controls = []
+    control.get_cmd_str(index=index, added_controls=added_controls)
+    for ctrl in added_controls:
+        ctrl._uid = uids.pop(0)
+        index[ctrl._uid] = ctrl
+
+
+def test_update_without_changes():
+    s = Stack(controls=[Text(value="a"), Text(value="b")])
+    index = {}
+    _add_to_index(s, index, ["_1", "_2", "_3"])
+
+    commands = []
+    s.build_update_commands(index, [], commands)
+    assert commands == [], "Test failed"
+    assert len(index) == 3, "Test failed"
+
+
+def test_update_remove_all_children():
+    s = Stack(controls=[Text(value="a"), Text(value="b")])
+    index = {}
+    _add_to_index(s, index, ["_1", "_2", "_3"])
+
+    s.controls.clear()
+    commands = []
+    s.build_update_commands(index, [], commands)
+    assert commands == [
+        Command(0, "remove", ["_2", "_3"], None, None, None)
+    ], "Test failed"
+    assert list(index) == ["_1"], "Test failed"
+
+
+def test_update_add_first_children():
+    s = Stack()
+    index = {}
+    _add_to_index(s, index, ["_1"])
+
+    t = Text(value="a")
+    s.controls.append(t)
+    added_controls = []
+    commands = []
+    s.build_update_commands(index, added_controls, commands)
+    assert commands == [
+        Command(
+            0,
+            "add",
+            None,
+            {"to": "_1", "at": "0"},
+            None,
+            [
+                Command(
+                    indent=0,
+                    name=None,
+                    values=["text"],
+                    attrs={"value": "a"},
+                    lines=[],
+                    commands=[],
+                )
+            ],
+        )
+    ], "Test failed"
+    assert added_controls == [t], "Test failed"
+
+
+def test_update_changed_attrs_only():
+    t1 = Text(value="a")
+    t2 = Text(value="b")
+    s = Stack(controls=[t1, t2])
+    index = {}
+    _add_to_index(s, index, ["_1", "_2", "_3"])
+
+    t2.value = "c"
+    t2.size = "large"
+    commands = []
+    s.build_update_commands(index, [], commands)
+    assert commands == [
+        Command(
+            indent=0,
+            name="set",
+            values=["_3"],
+            attrs={"size": "large", "value": "c"},
+            lines=[],
+            commands=[],
+        )
+    ], "Test failed"
+
+    commands = []
+    s.build_update_commands(index, [], commands)
+    assert commands == [], "Test failed"
+
+
+def test_update_batches_removed_children():
+    t1, t2, t3, t4 = Text(value="1"), Text(value="2"), Text(value="3"), Text(value="4")
+    s = Stack(controls=[t1, t2, t3, t4])
+    index = {}
+    _add_to_index(s, index, ["_1", "_2", "_3", "_4", "_5"])
+
+    t5 = Text(value="5")
+    s.controls = [t5, t2, t4]
+    commands = []
+    s.build_update_commands(index, [], commands)
+    assert commands == [
+        Command(0, "remove", ["_2", "_4"], None, None, None),
+        Command(
+            0,
+            "add",
+            None,
+            {"to": "_1", "at": "0"},
+            None,
+            [
+                Command(
+                    indent=0,
+                    name=None,
+                    values=["text"],
+                    attrs={"value": "5"},
+                    lines=[],
+                    commands=[],
+                )
+            ],
+        ),
+    ], "Test failed"
+    assert sorted(index) == ["_1", "_3", "_5"], "Test failed"
+
+
+def test_set_attrs():
+    t = Text(value="a")
+    t._set_attrs({"value": "b", "Size": "large", "color": None}, dirty=False)
+    assert t.value == "b", "Test failed"
+    assert t.size == "large", "Test failed"
+    assert t.color is None, "Test failed"
+    assert t.get_cmd_str() == [
+        Command(
+            indent=0,
+            name=None,
+            values=["text"],
+            attrs={"size": "large", "value": "b"},
+            lines=[],
+            commands=[],
+        )
+    ], "Test failed"
+
+
+def test_bulk_create():
+    stacks = Stack.bulk_create(3, horizontal=True, width=100)
+    assert len(stacks) == 3, "Test failed"
+    assert len({id(s) for s in stacks}) == 3, "Test failed"
+    stacks[1].controls.append(Text(value="a"))
+    stacks[2].width = 200
+    assert stacks[0].controls == [] and stacks[2].controls == [], "Test failed"
+    assert [s.width for s in stacks] == [100, 100, 200], "Test failed"
+    assert stacks[0].get_cmd_str() == [
+        Command(
+            indent=0,
+            name=None,
+            values=["stack"],
+            attrs={"horizontal": "true", "width": "100"},
+            lines=[],
+            commands=[],
+        )
+    ], "Test failed"
+
+
+def test_attr_prop_types_and_cast():
+    from pglet import SpinButton
+
+    sb = SpinButton(value=1)
+    sb._set_attrs({"value": "2.5", "focused": "true"}, dirty=False)
+    assert sb.value == 2.5, "Test failed"
+    assert sb.focused is True, "Test failed"
+    sb.min = None
+    try:
+        sb.step = "1"
+        assert False, "Test failed"
+    except TypeError:
+        pass
+
+
+def test_format_attr_value():
+    import datetime as dt
+    import enum
+
+    from pglet.control import _format_attr_value
+
+    class Size(enum.IntEnum):
+        BIG = 2
+
+    class Stamp(dt.datetime):
+        pass
+
+    assert _format_attr_value(True) == "true", "Test failed"
+    assert _format_attr_value(1.5) == "1.5", "Test failed"
+    assert _format_attr_value(Size.BIG) == str(Size.BIG), "Test failed"
+    assert _format_attr_value(Stamp(2022, 1, 2)) == "2022-01-02T00:00:00", "Test failed"
+    assert _format_attr_value(dt.date(2022, 1, 2)) == "2022-01-02", "Test failed"
+    assert _format_attr_value([1, 2]) == "[1, 2]", "Test failed"
+
+
+class _SetsAttrWhenFormatted:
+    # simulates another thread setting an attribute while a control is serialized
+    def __init__(self, control, name):
+        self.control = control
+        self.name = name
+
+    def __str__(self):
+        self.control._set_attr(self.name, "x")
+        return "v"
+
+
+def test_attr_added_during_serialization():
+    t = Text(value="a")
+    t._set_attr("data", _SetsAttrWhenFormatted(t, "zzz"))
+    cmd = t._get_cmd_attrs()
+    assert cmd.attrs == {"data": "v", "value": "a"}, "Test failed"
+    assert t._get_cmd_attrs().attrs["zzz"] == "x", "Test failed"
+
+
+def test_attr_changed_during_update_is_not_lost():
+    t = Text(value="a")
+    s = Stack(controls=[t])
+    index = {}
+    _add_to_index(s, index, ["_1", "_2"])
+
+    t.data = _SetsAttrWhenFormatted(t, "value")
+    assert t._get_cmd_attrs(update=True).attrs == {"data": "v"}, "Test failed"
+    assert t._get_cmd_attrs(update=True).attrs == {"value": "x"}, "Test failed"
+    assert t._get_cmd_attrs(update=True).attrs == {}, "Test failed"
@@ -1,2 +1,120 @@
+import threading
+
+from beartype.roar import BeartypeException
+
+from pglet import Button, Text
+from pglet.event import Event
+from pglet.page import Page
+
+
 def test_page(page):
     assert page.url != "" and page.url.startswith("http"), "Test failed"
+
+
+class _Results:
+    def __init__(self, results=None):
+        self.results = results or []
+        self.result = ""
+        self.error = ""
+
+
+class _FakeConnection:
+    page_name = "test_page"
+
+    def __init__(self):
+        self.next_id = 0
+
+    def send_commands(self, page_name, session_id, commands):
+        results = []
+        for cmd in commands:
+            if cmd.name == "add":
+                ids = []
+                for _ in cmd.commands:
+                    self.next_id += 1
+                    ids.append(f"_{self.next_id}")
+                results.append(" ".join(ids))
+            else:
+                results.append("")
+        return _Results(results)
+
+    def send_command(self, page_name, session_id, command):
+        return _Results()
+
+
+def _page_with_button(session_id, on_click):
+    p = Page(_FakeConnection(), session_id)
+    b = Button(text="OK", on_click=on_click)
+    p.add(b)
+    return p, b
+
+
+def test_blocked_handler_does_not_block_other_pages():
+    release = threading.Event()
+    clicked = threading.Event()
+    p1, b1 = _page_with_button("s1", lambda e: release.wait(5))
+    p2, b2 = _page_with_button("s2", lambda e: clicked.set())
+
+    for _ in range(10):
+        p1.on_event(Event(b1.uid, "click", ""))
+    p2.on_event(Event(b2.uid, "click", ""))
+    try:
+        assert clicked.wait(2), "Test failed"
+    finally:
+        release.set()
+
+
+def test_show_signin_ignores_stale_events():
+    p = Page(_FakeConnection(), "s1")
+    p.on_event(Event("page", "signin", ""))
+
+    result = []
+    th = threading.Thread(target=lambda: result.append(p.show_signin()), daemon=True)
+    th.start()
+    th.join(0.2)
+    assert th.is_alive(), "Test failed"
+
+    p.on_event(Event("page", "dismissSignin", ""))
+    th.join(2)
+    assert result == [False], "Test failed"
+
+
+def test_remove_several_controls():
+    p = Page(_FakeConnection(), "s1")
+    a, b, c = Text(value="a"), Text(value="b"), Text(value="c")
+    p.add(a, b, a, c)
+
+    p.remove(a, c)
+    assert p.controls == [b, a], "Test failed"
+
+    try:
+        p.remove(a, a)
+        assert False, "Test failed"
+    except ValueError:
+        pass
+    assert p.controls == [b, a], "Test failed"
+
+
+def test_setters_are_type_checked():
+    p = Page(_FakeConnection(), "s1")
+    p.theme = "dark"
+    try:
+        p.theme = "bogus"
+        assert False, "Test failed"
+    except BeartypeException:
+        pass
+
+
+def test_wait_event_after_clear_events():
+    p, b = _page_with_button("s1", lambda e: None)
+    p.on_event(Event(b.uid, "click", "old"))
+    p.clear_events()
+
+    result = []
+    th = threading.Thread(target=lambda: result.append(p.wait_event()), daemon=True)
+    th.start()
+    th.join(0.2)
+    assert th.is_alive(), "Test failed"
+
+    p.on_event(Event(b.uid, "click", "new"))
+    th.join(2)
+    assert [e.data for e in result] == ["new"], "Test failed"
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+import pglet.protocol as protocol
+from pglet.protocol import (
+    Actions,
+    Command,
+    Message,
+    PageCommandsBatchRequestPayload,
+    RegisterHostClientRequestPayload,
+)
+
+
+def test_release_commands_pool_is_capped(monkeypatch):
+    monkeypatch.setattr(protocol, "_pool_commands", True)
+    monkeypatch.setattr(protocol, "_command_pool", [])
+    monkeypatch.setattr(protocol, "_COMMAND_POOL_SIZE", 3)
+
+    commands = [
+        Command(0, "add", None, {}, None, [Command(2, None, ["text"], {}, [], [])])
+        for _ in range(5)
+    ]
+    protocol.release_commands(commands)
+    assert len(protocol._command_pool) == 3, "Test failed"
+
+    cmd = protocol.acquire_command(0, "set", ["_1"], {}, [], [])
+    assert cmd.name == "set" and cmd.values == ["_1"], "Test failed"
+    assert len(protocol._command_pool) == 2, "Test failed"
+
+
+# output of json.dumps(msg, default=vars) with the original dataclass protocol
+_BATCH_JSON = (
+    '{"id": "1", "action": "pageCommandsBatchFromHost", "payload": {"pageName": "p", '
+    '"sessionID": "s", "commands": [{"indent": 0, "name": "add", "values": null, '
+    '"attrs": {"to": "page", "at": "0"}, "lines": null, "commands": [{"indent": 2, '
+    '"name": null, "values": ["text"], "attrs": {"value": "a"}, "lines": [], '
+    '"commands": []}]}, {"indent": 0, "name": "remove", "values": ["_2", "_3"], '
+    '"attrs": null, "lines": null, "commands": null}]}}'
+)
+_REGISTER_JSON = (
+    '{"id": "2", "action": "registerHostClient", "payload": {"hostClientID": null, '
+    '"pageName": "p", "isApp": false, "update": true, "authToken": null, '
+    '"permissions": null}}'
+)
+
+
+@pytest.mark.parametrize(
+    "dumps",
+    [protocol._json_dumps, protocol._json_dumps_stdlib],
+    ids=["default", "stdlib"],
+)
+def test_message_encoding(dumps):
+    msg = Message(
+        "1",
+        Actions.PAGE_COMMANDS_BATCH_FROM_HOST,
+        PageCommandsBatchRequestPayload(
+            "p",
+            "s",
+            [
+                Command(
+                    0,
+                    "add",
+                    None,
+                    {"to": "page", "at": "0"},
+                    None,
+                    [Command(2, None, ["text"], {"value": "a"}, [], [])],
+                ),
+                Command(0, "remove", ["_2", "_3"], None, None, None),
+            ],
+        ),
+    )
+    j = dumps(msg)
+    assert json.loads(j) == json.loads(_BATCH_JSON), "Test failed"
+    assert protocol._json_loads(j) == json.loads(_BATCH_JSON), "Test failed"
+
+    msg = Message(
+        "2",
+        Actions.REGISTER_HOST_CLIENT,
+        RegisterHostClientRequestPayload(None, "p", False, True, None, None),
+    )
+    assert json.loads(dumps(msg)) == json.loads(_REGISTER_JSON), "Test failed"
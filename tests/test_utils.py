@@ -0,0 +1,9 @@
+from pglet.utils import is_localhost_url
+
+
+def test_is_localhost_url():
+    assert is_localhost_url("http://localhost:8550/page-1"), "Test failed"
+    assert is_localhost_url("ws://localhost/ws"), "Test failed"
+    assert is_localhost_url("ws://127.0.0.1:8550/ws"), "Test failed"
+    assert not is_localhost_url("https://app.pglet.io"), "Test failed"
+    assert not is_localhost_url("http://evil.com/?x=://localhost/"), "Test failed"